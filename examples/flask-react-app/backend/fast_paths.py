@@ -0,0 +1,36 @@
+#!/usr/bin/env python3
+"""
+Hot-path helpers for the Flask backend
+
+Kept free of Flask/SQLAlchemy imports and fully type-annotated so the
+module can be AOT-compiled with mypyc (`mypyc fast_paths.py`). app.py
+imports these names normally and transparently picks up the compiled
+extension when one is present; this pure-Python version is the fallback.
+"""
+
+import hashlib
+from datetime import datetime
+from typing import Any, Dict, Optional
+
+
+def token_cache_key(token: str) -> str:
+    """Cache key for a raw bearer token"""
+    return hashlib.sha256(token.encode()).hexdigest()[:32]
+
+
+def task_row_to_dict(id: int, title: str, description: Optional[str],
+                     completed: bool, priority: str,
+                     due_date: Optional[datetime], created_at: datetime,
+                     updated_at: datetime, user_id: int) -> Dict[str, Any]:
+    """Build a task response dict straight from a column row"""
+    return {
+        'id': id,
+        'title': title,
+        'description': description,
+        'completed': completed,
+        'priority': priority,
+        'due_date': due_date,
+        'created_at': created_at,
+        'updated_at': updated_at,
+        'user_id': user_id
+    }
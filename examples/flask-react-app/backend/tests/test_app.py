@@ -6,19 +6,35 @@ Test suite for Flask backend
 import pytest
 import json
 from datetime import datetime
+from sqlalchemy.pool import StaticPool
 from app import app, db, User, Task
 
-@pytest.fixture
-def client():
-    """Test client fixture"""
+@pytest.fixture(scope='session')
+def _database():
+    """Session-scoped in-memory database - schema is built exactly once"""
     app.config['TESTING'] = True
     app.config['SQLALCHEMY_DATABASE_URI'] = 'sqlite:///:memory:'
-    
+    # StaticPool keeps the single in-memory DB alive across connections
+    app.config['SQLALCHEMY_ENGINE_OPTIONS'] = {
+        'poolclass': StaticPool,
+        'connect_args': {'check_same_thread': False}
+    }
+
+    with app.app_context():
+        db.create_all()
+        yield db
+        db.drop_all()
+
+@pytest.fixture
+def client(_database):
+    """Test client fixture - truncates tables instead of rebuilding schema"""
     with app.test_client() as client:
         with app.app_context():
-            db.create_all()
             yield client
-            db.drop_all()
+            db.session.remove()
+            for table in reversed(db.metadata.sorted_tables):
+                db.session.execute(table.delete())
+            db.session.commit()
 
 @pytest.fixture
 def auth_headers(client):
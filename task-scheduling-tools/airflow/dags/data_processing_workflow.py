@@ -1,48 +1,12 @@
 from datetime import datetime, timedelta
-from airflow import DAG
+from airflow.decorators import dag, task
 from airflow.operators.bash import BashOperator
-from airflow.operators.python import PythonOperator
 import json
+import numpy as np
 
-def extract_data():
-    """Simulate data extraction"""
-    data = {
-        'timestamp': datetime.now().isoformat(),
-        'records': [
-            {'id': 1, 'name': 'Alice', 'score': 85},
-            {'id': 2, 'name': 'Bob', 'score': 92},
-            {'id': 3, 'name': 'Charlie', 'score': 78}
-        ]
-    }
-    print(f"Extracted {len(data['records'])} records")
-    return data
-
-def transform_data(**context):
-    """Transform the extracted data"""
-    data = context['task_instance'].xcom_pull(task_ids='extract')
-    
-    # Add grade based on score
-    for record in data['records']:
-        if record['score'] >= 90:
-            record['grade'] = 'A'
-        elif record['score'] >= 80:
-            record['grade'] = 'B'
-        else:
-            record['grade'] = 'C'
-    
-    print(f"Transformed {len(data['records'])} records")
-    return data
-
-def load_data(**context):
-    """Load the transformed data"""
-    data = context['task_instance'].xcom_pull(task_ids='transform')
-    
-    # Simulate saving to database
-    print("Loading data to database:")
-    for record in data['records']:
-        print(f"  ID: {record['id']}, Name: {record['name']}, Score: {record['score']}, Grade: {record['grade']}")
-    
-    return f"Successfully loaded {len(data['records'])} records"
+# Grade boundaries: C < 80 <= B < 90 <= A
+GRADE_BOUNDARIES = [80, 90]
+GRADE_LABELS = np.array(['C', 'B', 'A'])
 
 default_args = {
     'owner': 'data-team',
@@ -54,49 +18,78 @@ default_args = {
     'retry_delay': timedelta(minutes=5),
 }
 
-dag = DAG(
-    'data_processing_workflow',
+@dag(
+    dag_id='data_processing_workflow',
     default_args=default_args,
     description='ETL workflow for data processing',
     schedule_interval=timedelta(hours=1),  # Run every hour
     catchup=False,
+    max_active_tasks=4,  # Allow independent levels to run side by side
     tags=['etl', 'data-processing'],
 )
+def data_processing_workflow():
+    """
+    TaskFlow version of the ETL pipeline: the data dict flows through
+    return values instead of manual xcom_pull calls, so it is stored
+    once per edge rather than re-fetched and re-deserialized by every
+    consumer. For real record volumes, point Airflow at a blob-store
+    XCom backend and only the reference travels through the metadata DB.
+    """
 
-# Task 1: Extract data
-extract_task = PythonOperator(
-    task_id='extract',
-    python_callable=extract_data,
-    dag=dag,
-)
+    @task
+    def extract():
+        """Simulate data extraction"""
+        data = {
+            'timestamp': datetime.now().isoformat(),
+            'records': [
+                {'id': 1, 'name': 'Alice', 'score': 85},
+                {'id': 2, 'name': 'Bob', 'score': 92},
+                {'id': 3, 'name': 'Charlie', 'score': 78}
+            ]
+        }
+        print(f"Extracted {len(data['records'])} records")
+        return data
 
-# Task 2: Transform data
-transform_task = PythonOperator(
-    task_id='transform',
-    python_callable=transform_data,
-    dag=dag,
-)
+    @task
+    def transform(data):
+        """Transform the extracted data"""
+        # Add grade based on score - one branchless searchsorted over a
+        # contiguous array instead of per-record if/elif chains
+        records = data['records']
+        scores = np.fromiter((r['score'] for r in records), dtype=np.int16, count=len(records))
+        grades = GRADE_LABELS[np.searchsorted(GRADE_BOUNDARIES, scores, side='right')]
+        for record, grade in zip(records, grades.tolist()):
+            record['grade'] = grade
 
-# Task 3: Validate data
-validate_task = BashOperator(
-    task_id='validate',
-    bash_command='echo "Data validation completed successfully"',
-    dag=dag,
-)
+        print(f"Transformed {len(records)} records")
+        return data
 
-# Task 4: Load data
-load_task = PythonOperator(
-    task_id='load',
-    python_callable=load_data,
-    dag=dag,
-)
+    @task
+    def load(data):
+        """Load the transformed data"""
+        # Simulate saving to database
+        print("Loading data to database:")
+        for record in data['records']:
+            print(f"  ID: {record['id']}, Name: {record['name']}, Score: {record['score']}, Grade: {record['grade']}")
 
-# Task 5: Cleanup
-cleanup_task = BashOperator(
-    task_id='cleanup',
-    bash_command='echo "Cleaning up temporary files..." && sleep 2 && echo "Cleanup completed"',
-    dag=dag,
-)
+        return f"Successfully loaded {len(data['records'])} records"
+
+    validate_task = BashOperator(
+        task_id='validate',
+        bash_command='echo "Data validation completed successfully"',
+    )
+
+    cleanup_task = BashOperator(
+        task_id='cleanup',
+        bash_command='echo "Cleaning up temporary files..." && sleep 2 && echo "Cleanup completed"',
+    )
+
+    # Define task dependencies as levels rather than one strict chain:
+    # validate only echoes and load only needs transform's output, so both
+    # can run in parallel once transform finishes. cleanup waits for both.
+    transformed = transform(extract())
+    loaded = load(transformed)
+    validate_task.set_upstream(transformed.operator)
+    cleanup_task.set_upstream([validate_task, loaded.operator])
 
-# Define task dependencies
-extract_task >> transform_task >> validate_task >> load_task >> cleanup_task
\ No newline at end of file
+dag = data_processing_workflow()
@@ -4,6 +4,7 @@ from prefect import serve
 from prefect.deployments import Deployment
 from prefect.server.schemas.schedules import IntervalSchedule, CronSchedule
 from datetime import timedelta
+import asyncio
 
 # Import all flows
 from flows.data_processing_flow import data_processing_workflow
@@ -69,15 +70,20 @@ def create_all_deployments():
     
     return deployments
 
-def deploy_all():
+async def deploy_all():
     """Deploy all flows"""
     deployments = create_all_deployments()
-    
+
+    # No deployment depends on another's apply result, so fan the API
+    # round-trips out concurrently (apply() itself is sync under the
+    # hood, hence the to_thread wrapper)
     print("Creating deployments...")
+    await asyncio.gather(
+        *(asyncio.to_thread(deployment.apply) for deployment in deployments)
+    )
     for deployment in deployments:
-        deployment.apply()
         print(f"✅ Created deployment: {deployment.name}")
-    
+
     print(f"\n🎉 Successfully created {len(deployments)} deployments!")
     print("\nDeployment Summary:")
     print("==================")
@@ -90,4 +96,4 @@ def deploy_all():
     print("docker-compose exec prefect-server prefect agent start -q 'default'")
 
 if __name__ == "__main__":
-    deploy_all()
\ No newline at end of file
+    asyncio.run(deploy_all())
\ No newline at end of file
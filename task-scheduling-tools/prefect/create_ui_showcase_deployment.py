@@ -3,22 +3,37 @@
 Create deployments for the UI Showcase flows
 """
 
+from types import MappingProxyType
+
 from prefect.deployments import Deployment
 from flows.ui_showcase_flow import ui_showcase_pipeline, advanced_showcase_pipeline, DataProcessingConfig
 
+# The parameters are literal constants - freeze them as plain dicts so
+# re-imports skip the Pydantic construct-and-dump pipeline entirely
+_BASIC_PARAMS = MappingProxyType({
+    "batch_size": 100,
+    "environment": "development",
+    "enable_validation": True,
+    "max_retries": 3
+})
+
+_ADVANCED_PARAMS = MappingProxyType({
+    "batch_size": 200,
+    "environment": "production",
+    "enable_validation": True,
+    "max_retries": 5
+})
+
+# Validate both parameter sets once at import
+DataProcessingConfig.model_validate(dict(_BASIC_PARAMS))
+DataProcessingConfig.model_validate(dict(_ADVANCED_PARAMS))
+
 # Create deployment for basic UI showcase
 basic_deployment = Deployment.build_from_flow(
     flow=ui_showcase_pipeline,
     name="ui-showcase-basic",
     description="Basic UI showcase pipeline demonstrating visual workflow features",
-    parameters={
-        "config": DataProcessingConfig(
-            batch_size=100,
-            environment="development",
-            enable_validation=True,
-            max_retries=3
-        ).model_dump()
-    },
+    parameters={"config": dict(_BASIC_PARAMS)},
     work_pool_name="default-agent-pool",
     tags=["demo", "ui-showcase", "development"]
 )
@@ -28,14 +43,7 @@ advanced_deployment = Deployment.build_from_flow(
     flow=advanced_showcase_pipeline,
     name="ui-showcase-advanced",
     description="Advanced UI showcase with subflows and complex orchestration",
-    parameters={
-        "config": DataProcessingConfig(
-            batch_size=200,
-            environment="production",
-            enable_validation=True,
-            max_retries=5
-        ).model_dump()
-    },
+    parameters={"config": dict(_ADVANCED_PARAMS)},
     work_pool_name="default-agent-pool",
     tags=["demo", "ui-showcase", "production", "subflows"]
 )
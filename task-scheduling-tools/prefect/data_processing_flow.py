@@ -1,13 +1,35 @@
-from prefect import flow, task
+from prefect import flow, task, get_run_logger
 from datetime import datetime, timedelta
+import asyncio
 import json
-import time
+import os
+
+import orjson
+
+import numpy as np
+
+# Grade boundaries: C < 80 <= B < 90 <= A
+GRADE_BOUNDARIES = [80, 90]
+GRADE_LABELS = np.array(['C', 'B', 'A'])
+
+# Record schema compiled once - validation is a single C-level set
+# comparison per record instead of a per-key membership loop
+REQUIRED_RECORD_KEYS = frozenset(('id', 'name', 'score', 'grade'))
+
+# Simulated latency is opt-in so production and CI runs skip it entirely
+SIMULATE_LATENCY = bool(os.getenv('SIMULATE_LATENCY'))
+
+async def simulated_latency(seconds):
+    """Stand-in for processing time that doesn't block the event loop"""
+    if SIMULATE_LATENCY:
+        await asyncio.sleep(seconds)
 
 @task(retries=2, retry_delay_seconds=30)
-def extract_data():
+async def extract_data():
     """Simulate data extraction"""
-    print("Starting data extraction...")
-    time.sleep(2)  # Simulate processing time
+    logger = get_run_logger()
+    logger.info("Starting data extraction...")
+    await simulated_latency(2)
     
     data = {
         'timestamp': datetime.now().isoformat(),
@@ -17,99 +39,105 @@ def extract_data():
             {'id': 3, 'name': 'Charlie', 'score': 78}
         ]
     }
-    print(f"Extracted {len(data['records'])} records")
+    logger.info("Extracted %d records", len(data['records']))
     return data
 
 @task(retries=2, retry_delay_seconds=30)
-def transform_data(data):
+async def transform_data(data):
     """Transform the extracted data"""
-    print("Starting data transformation...")
-    time.sleep(1)  # Simulate processing time
+    logger = get_run_logger()
+    logger.info("Starting data transformation...")
+    await simulated_latency(1)
     
-    # Add grade based on score
-    for record in data['records']:
-        if record['score'] >= 90:
-            record['grade'] = 'A'
-        elif record['score'] >= 80:
-            record['grade'] = 'B'
-        else:
-            record['grade'] = 'C'
+    # Add grade based on score - one branchless searchsorted over a
+    # contiguous array instead of per-record if/elif chains
+    records = data['records']
+    scores = np.fromiter((r['score'] for r in records), dtype=np.int16, count=len(records))
+    grades = GRADE_LABELS[np.searchsorted(GRADE_BOUNDARIES, scores, side='right')]
+    for record, grade in zip(records, grades.tolist()):
+        record['grade'] = grade
     
-    print(f"Transformed {len(data['records'])} records")
+    logger.info("Transformed %d records", len(records))
     return data
 
 @task(retries=2, retry_delay_seconds=30)
-def validate_data(data):
+async def validate_data(data):
     """Validate the transformed data"""
-    print("Starting data validation...")
-    time.sleep(1)  # Simulate processing time
+    logger = get_run_logger()
+    logger.info("Starting data validation...")
+    await simulated_latency(1)
     
     # Simple validation
     for record in data['records']:
-        if not all(key in record for key in ['id', 'name', 'score', 'grade']):
+        if not REQUIRED_RECORD_KEYS <= record.keys():
             raise ValueError(f"Invalid record: {record}")
     
-    print("Data validation completed successfully")
+    logger.info("Data validation completed successfully")
     return True
 
 @task(retries=2, retry_delay_seconds=30)
-def load_data(data):
+async def load_data(data):
     """Load the transformed data"""
-    print("Starting data loading...")
-    time.sleep(2)  # Simulate processing time
+    logger = get_run_logger()
+    logger.info("Starting data loading...")
+    await simulated_latency(2)
     
-    # Simulate saving to database
-    print("Loading data to database:")
-    for record in data['records']:
-        print(f"  ID: {record['id']}, Name: {record['name']}, Score: {record['score']}, Grade: {record['grade']}")
-    
-    result = f"Successfully loaded {len(data['records'])} records"
-    print(result)
+    # Simulate saving to database - one C-level orjson serialization
+    # and one batched log line instead of an f-string and log POST per
+    # record
+    records = data['records']
+    logger.info("Loading %d records to database: %s",
+                len(records), orjson.dumps(records).decode())
+
+    result = f"Successfully loaded {len(records)} records"
+    logger.info(result)
     return result
 
 @task
-def cleanup():
+async def cleanup():
     """Cleanup temporary resources"""
-    print("Cleaning up temporary files...")
-    time.sleep(1)  # Simulate cleanup time
-    print("Cleanup completed")
+    logger = get_run_logger()
+    logger.info("Cleaning up temporary files...")
+    await simulated_latency(1)
+    logger.info("Cleanup completed")
     return "Cleanup successful"
 
-@flow(name="Data Processing Workflow", log_prints=True)
-def data_processing_workflow():
+@flow(name="Data Processing Workflow")
+async def data_processing_workflow():
     """
     ETL workflow for data processing
     Runs: Extract -> Transform -> Validate -> Load -> Cleanup
     """
-    print("Starting Data Processing Workflow")
+    logger = get_run_logger()
+    logger.info("Starting Data Processing Workflow")
     
     # Extract data
-    raw_data = extract_data()
+    raw_data = await extract_data()
     
     # Transform data
-    transformed_data = transform_data(raw_data)
+    transformed_data = await transform_data(raw_data)
     
     # Validate data
-    validation_result = validate_data(transformed_data)
+    validation_result = await validate_data(transformed_data)
     
     # Load data (only if validation passes)
     if validation_result:
-        load_result = load_data(transformed_data)
+        load_result = await load_data(transformed_data)
         
         # Cleanup
-        cleanup_result = cleanup()
+        cleanup_result = await cleanup()
         
-        print("Workflow completed successfully!")
+        logger.info("Workflow completed successfully!")
         return {
             'status': 'success',
             'load_result': load_result,
             'cleanup_result': cleanup_result
         }
     else:
-        print("Workflow failed validation!")
+        logger.info("Workflow failed validation!")
         return {'status': 'failed', 'reason': 'validation_failed'}
 
 if __name__ == "__main__":
     # Run the flow locally
-    result = data_processing_workflow()
+    result = asyncio.run(data_processing_workflow())
     print(f"Final result: {result}")
\ No newline at end of file
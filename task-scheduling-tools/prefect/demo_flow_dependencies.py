@@ -4,6 +4,23 @@ import asyncio
 import time
 from datetime import datetime
 from prefect.client.orchestration import PrefectClient
+from prefect.events.clients import get_events_subscriber
+from prefect.events.filters import EventFilter, EventNameFilter, EventResourceFilter
+
+async def wait_for_terminal_state(client, flow_run_id):
+    """Wake on a run's terminal event instead of polling on an interval"""
+    event_filter = EventFilter(
+        event=EventNameFilter(name=[
+            "prefect.flow-run.Completed",
+            "prefect.flow-run.Failed",
+            "prefect.flow-run.Crashed",
+            "prefect.flow-run.Cancelled"
+        ]),
+        resource=EventResourceFilter(id=[f"prefect.flow-run.{flow_run_id}"])
+    )
+    async with get_events_subscriber(filter=event_filter) as subscriber:
+        async for event in subscriber:
+            return await client.read_flow_run(flow_run_id)
 
 async def demo_flow_dependencies():
     """
@@ -11,48 +28,52 @@ async def demo_flow_dependencies():
     """
     print("🔧 Prefect Flow Dependencies Demo")
     print("==================================")
-    
+
     async with PrefectClient() as client:
         print("\n📋 Available Flows:")
         flows = await client.read_flows()
+        # Bucket the flows in one pass instead of filtering the list twice
+        upstream_flows = []
+        orchestrator_flows = []
         for flow in flows:
             print(f"  - {flow.name}")
-        
-        print("\n🚀 Demo 1: Sequential Flow Execution")
-        print("------------------------------------")
-        
-        # Run upstream flow first
-        print("Starting upstream flow...")
-        upstream_flows = [f for f in flows if "Upstream" in f.name]
-        if upstream_flows:
-            upstream_run = await client.create_flow_run(flow=upstream_flows[0])
-            print(f"Created upstream run: {upstream_run.id}")
-            
-            # Wait a bit
-            await asyncio.sleep(5)
-            
-            # Check status
-            run_status = await client.read_flow_run(upstream_run.id)
-            print(f"Upstream status: {run_status.state.type}")
-        
-        print("\n🚀 Demo 2: Orchestrated Flow Execution")
+            if "Upstream" in flow.name:
+                upstream_flows.append(flow)
+            elif "Orchestrator" in flow.name:
+                orchestrator_flows.append(flow)
+
+        print("\n🚀 Demo 1+2: Concurrent Flow Execution")
         print("--------------------------------------")
-        
-        # Run orchestrator flow
-        orchestrator_flows = [f for f in flows if "Orchestrator" in f.name]
-        if orchestrator_flows:
-            orchestrator_run = await client.create_flow_run(flow=orchestrator_flows[0])
+
+        # The upstream and orchestrator runs are independent - create
+        # them in one concurrent batch
+        runs = await asyncio.gather(
+            *(client.create_flow_run(flow=f[0])
+              for f in (upstream_flows, orchestrator_flows) if f)
+        )
+        upstream_run = runs[0] if upstream_flows else None
+        orchestrator_run = runs[-1] if orchestrator_flows else None
+
+        if upstream_run:
+            print(f"Created upstream run: {upstream_run.id}")
+
+        if orchestrator_run:
             print(f"Created orchestrator run: {orchestrator_run.id}")
-            
-            # Monitor progress
-            for i in range(6):  # Check for 30 seconds
-                await asyncio.sleep(5)
-                run_status = await client.read_flow_run(orchestrator_run.id)
+
+            # Wait for the terminal event rather than sleep-polling
+            try:
+                run_status = await asyncio.wait_for(
+                    wait_for_terminal_state(client, orchestrator_run.id),
+                    timeout=30
+                )
                 print(f"Orchestrator status: {run_status.state.type}")
-                
-                if run_status.state.is_completed() or run_status.state.is_failed():
-                    break
-        
+            except asyncio.TimeoutError:
+                print("Orchestrator still running after 30s")
+
+        if upstream_run:
+            run_status = await client.read_flow_run(upstream_run.id)
+            print(f"Upstream status: {run_status.state.type}")
+
         print("\n📊 Recent Flow Runs:")
         print("-------------------")
         recent_runs = await client.read_flow_runs(limit=10)
@@ -70,7 +91,7 @@ def demo_local_dependencies():
     from flows.orchestrator_flow import orchestrator_flow
     
     print("Running orchestrator flow locally...")
-    result = orchestrator_flow()
+    result = asyncio.run(orchestrator_flow())
     
     print(f"Orchestrator result: {result['status']}")
     print(f"Flows executed: {result['flows_executed']}")
@@ -3,75 +3,146 @@
 from prefect import flow, task, get_run_logger
 from prefect.client.orchestration import PrefectClient
 from prefect.client.schemas import FlowRun
+from prefect.events.clients import get_events_subscriber
+from prefect.events.filters import EventFilter, EventNameFilter, EventResourceFilter
+from prefect.exceptions import ObjectNotFound
 from prefect.states import Completed, Failed, Running
+from contextlib import asynccontextmanager
 from datetime import datetime, timedelta
 import asyncio
 import time
 import json
 
+@asynccontextmanager
+async def _client_ctx(client=None):
+    """
+    Reuse an injected PrefectClient, or open a short-lived one.
+    Sharing one client keeps a single TCP/TLS session and connection
+    pool alive across all API calls in a flow run.
+    """
+    if client is not None:
+        yield client
+    else:
+        async with PrefectClient() as owned:
+            yield owned
+
+async def _await_flow_completion(client, flow_name: str):
+    """
+    Resolve the latest run of a flow, waking on its Completed/Failed
+    event instead of polling on an interval
+    """
+    logger = get_run_logger()
+
+    # One lookup to locate the latest run and catch already-finished flows
+    flow_runs = await client.read_flow_runs(
+        flow_filter={"name": {"any_": [flow_name]}},
+        limit=1,
+        sort="EXPECTED_START_TIME_DESC"
+    )
+    latest_run = flow_runs[0] if flow_runs else None
+
+    if latest_run:
+        logger.info(f"Latest run state: {latest_run.state.type}")
+
+        if latest_run.state.is_completed():
+            return latest_run
+        elif latest_run.state.is_failed():
+            raise Exception(f"Flow '{flow_name}' failed!")
+
+    # Not terminal yet - subscribe to the run's terminal events so the
+    # coroutine sleeps until the server pushes the state change
+    event_filter = EventFilter(
+        event=EventNameFilter(name=[
+            "prefect.flow-run.Completed",
+            "prefect.flow-run.Failed"
+        ])
+    )
+    if latest_run is not None:
+        event_filter.resource = EventResourceFilter(
+            id=[f"prefect.flow-run.{latest_run.id}"]
+        )
+
+    async with get_events_subscriber(filter=event_filter) as subscriber:
+        async for event in subscriber:
+            if event.event.endswith("Failed"):
+                raise Exception(f"Flow '{flow_name}' failed!")
+            # Point-lookup by primary key - no filter+sort query and no
+            # page of FlowRun objects just to take the first element
+            if latest_run is not None:
+                run_id = latest_run.id
+            else:
+                run_id = event.resource.id.rpartition('.')[2]
+            return await client.read_flow_run(run_id)
+
 @task
-async def wait_for_flow_completion(flow_name: str, timeout_minutes: int = 30):
+async def wait_for_flow_completion(flow_name: str, timeout_minutes: int = 30, client=None):
     """
     Wait for a specific flow to complete successfully
     This demonstrates how to check flow run states
     """
     logger = get_run_logger()
     logger.info(f"Waiting for flow '{flow_name}' to complete...")
-    
-    async with PrefectClient() as client:
-        timeout = datetime.now() + timedelta(minutes=timeout_minutes)
-        
-        while datetime.now() < timeout:
-            # Get recent flow runs for the specified flow
-            flow_runs = await client.read_flow_runs(
-                flow_filter={"name": {"any_": [flow_name]}},
-                limit=5,
-                sort="EXPECTED_START_TIME_DESC"
+
+    async with _client_ctx(client) as client:
+        try:
+            latest_run = await asyncio.wait_for(
+                _await_flow_completion(client, flow_name),
+                timeout=timeout_minutes * 60
             )
-            
-            if flow_runs:
-                latest_run = flow_runs[0]
-                logger.info(f"Latest run state: {latest_run.state.type}")
-                
-                if latest_run.state.is_completed():
-                    logger.info(f"Flow '{flow_name}' completed successfully!")
-                    return {
-                        'flow_name': flow_name,
-                        'run_id': str(latest_run.id),
-                        'state': latest_run.state.type.value,
-                        'completion_time': latest_run.end_time.isoformat() if latest_run.end_time else None
-                    }
-                elif latest_run.state.is_failed():
-                    raise Exception(f"Flow '{flow_name}' failed!")
-            
-            # Wait before checking again
-            await asyncio.sleep(10)
-        
-        raise TimeoutError(f"Timeout waiting for flow '{flow_name}' to complete")
+        except asyncio.TimeoutError:
+            raise TimeoutError(f"Timeout waiting for flow '{flow_name}' to complete")
+
+        logger.info(f"Flow '{flow_name}' completed successfully!")
+        return {
+            'flow_name': flow_name,
+            'run_id': str(latest_run.id),
+            'state': latest_run.state.type.value,
+            'completion_time': latest_run.end_time.isoformat() if latest_run.end_time else None
+        }
+
+# Flow ids are stable once registered - cache name lookups so repeated
+# triggers of the same flow skip the read_flows round-trip
+_flow_cache = {}
+
+async def _get_flow_cached(client, flow_name: str):
+    """Resolve a flow by name, memoizing the result"""
+    flow = _flow_cache.get(flow_name)
+    if flow is None:
+        flows = await client.read_flows(flow_filter={"name": {"any_": [flow_name]}})
+
+        if not flows:
+            raise ValueError(f"Flow '{flow_name}' not found")
+
+        flow = _flow_cache[flow_name] = flows[0]
+    return flow
 
 @task
-async def trigger_flow_run(flow_name: str, parameters: dict = None):
+async def trigger_flow_run(flow_name: str, parameters: dict = None, client=None):
     """
     Trigger a flow run programmatically
     """
     logger = get_run_logger()
     logger.info(f"Triggering flow run for '{flow_name}'")
-    
-    async with PrefectClient() as client:
-        # Find the flow
-        flows = await client.read_flows(flow_filter={"name": {"any_": [flow_name]}})
-        
-        if not flows:
-            raise ValueError(f"Flow '{flow_name}' not found")
-        
-        flow = flows[0]
-        
+
+    async with _client_ctx(client) as client:
+        # Find the flow (cached after the first lookup)
+        flow = await _get_flow_cached(client, flow_name)
+
         # Create a flow run
-        flow_run = await client.create_flow_run(
-            flow=flow,
-            parameters=parameters or {}
-        )
-        
+        try:
+            flow_run = await client.create_flow_run(
+                flow=flow,
+                parameters=parameters or {}
+            )
+        except ObjectNotFound:
+            # Stale cache entry (flow re-registered) - refresh and retry once
+            _flow_cache.pop(flow_name, None)
+            flow = await _get_flow_cached(client, flow_name)
+            flow_run = await client.create_flow_run(
+                flow=flow,
+                parameters=parameters or {}
+            )
+
         logger.info(f"Created flow run: {flow_run.id}")
         return {
             'flow_name': flow_name,
@@ -86,23 +157,20 @@ def process_conditional_logic(upstream_results: list):
     """
     logger = get_run_logger()
     logger.info("Processing conditional logic...")
-    
-    successful_flows = [
-        result for result in upstream_results 
-        if result.get('state') == 'COMPLETED'
-    ]
-    
-    failed_flows = [
-        result for result in upstream_results 
-        if result.get('state') == 'FAILED'
-    ]
-    
+
+    # Single counting pass - no intermediate lists just to take len()
+    successful = failed = 0
+    for result in upstream_results:
+        state = result.get('state')
+        successful += (state == 'COMPLETED')
+        failed += (state == 'FAILED')
+
     logic_result = {
         'total_flows': len(upstream_results),
-        'successful_flows': len(successful_flows),
-        'failed_flows': len(failed_flows),
-        'success_rate': len(successful_flows) / len(upstream_results) if upstream_results else 0,
-        'should_proceed': len(successful_flows) >= len(upstream_results) * 0.8  # 80% success rate
+        'successful_flows': successful,
+        'failed_flows': failed,
+        'success_rate': successful / len(upstream_results) if upstream_results else 0,
+        'should_proceed': successful >= len(upstream_results) * 0.8  # 80% success rate
     }
     
     logger.info(f"Conditional logic result: {logic_result}")
@@ -122,57 +190,67 @@ async def advanced_dependencies_flow():
         "Upstream Data Preparation"
     ]
     
-    # Wait for all prerequisite flows to complete
-    logger.info("Waiting for prerequisite flows...")
-    prerequisite_results = []
-    
-    for flow_name in prerequisite_flows:
-        try:
-            result = await wait_for_flow_completion(flow_name, timeout_minutes=5)
-            prerequisite_results.append(result)
-        except Exception as e:
-            logger.warning(f"Flow '{flow_name}' failed or timed out: {e}")
-            prerequisite_results.append({
-                'flow_name': flow_name,
-                'state': 'FAILED',
-                'error': str(e)
-            })
-    
-    # Process conditional logic
-    logic_result = process_conditional_logic(prerequisite_results)
-    
-    if logic_result['should_proceed']:
-        logger.info("Conditions met - proceeding with dependent processing")
-        
-        # Trigger dependent flow
-        dependent_trigger = await trigger_flow_run(
-            "Downstream Data Processing",
-            parameters={'triggered_by': 'advanced_dependencies_flow'}
-        )
-        
-        # Wait for dependent flow to complete
-        dependent_result = await wait_for_flow_completion(
-            "Downstream Data Processing", 
-            timeout_minutes=10
+    # One client for every API call in this flow run - concurrent waits
+    # share its connection pool instead of opening a session each
+    async with PrefectClient() as client:
+        # Wait for all prerequisite flows concurrently - they are
+        # independent, so the phase costs max(wait) instead of the sum
+        logger.info("Waiting for prerequisite flows...")
+        outcomes = await asyncio.gather(
+            *(wait_for_flow_completion(flow_name, timeout_minutes=5, client=client)
+              for flow_name in prerequisite_flows),
+            return_exceptions=True
         )
-        
-        final_result = {
-            'status': 'success',
-            'prerequisite_results': prerequisite_results,
-            'logic_result': logic_result,
-            'dependent_trigger': dependent_trigger,
-            'dependent_result': dependent_result,
-            'completion_time': datetime.now().isoformat()
-        }
-    else:
-        logger.warning("Conditions not met - skipping dependent processing")
-        final_result = {
-            'status': 'skipped',
-            'reason': 'prerequisite_conditions_not_met',
-            'prerequisite_results': prerequisite_results,
-            'logic_result': logic_result,
-            'completion_time': datetime.now().isoformat()
-        }
+
+        prerequisite_results = []
+        for flow_name, outcome in zip(prerequisite_flows, outcomes):
+            if isinstance(outcome, Exception):
+                logger.warning(f"Flow '{flow_name}' failed or timed out: {outcome}")
+                prerequisite_results.append({
+                    'flow_name': flow_name,
+                    'state': 'FAILED',
+                    'error': str(outcome)
+                })
+            else:
+                prerequisite_results.append(outcome)
+
+        # Process conditional logic
+        logic_result = process_conditional_logic(prerequisite_results)
+
+        if logic_result['should_proceed']:
+            logger.info("Conditions met - proceeding with dependent processing")
+
+            # Trigger dependent flow
+            dependent_trigger = await trigger_flow_run(
+                "Downstream Data Processing",
+                parameters={'triggered_by': 'advanced_dependencies_flow'},
+                client=client
+            )
+
+            # Wait for dependent flow to complete
+            dependent_result = await wait_for_flow_completion(
+                "Downstream Data Processing",
+                timeout_minutes=10,
+                client=client
+            )
+
+            final_result = {
+                'status': 'success',
+                'prerequisite_results': prerequisite_results,
+                'logic_result': logic_result,
+                'dependent_trigger': dependent_trigger,
+                'dependent_result': dependent_result,
+                'completion_time': datetime.now().isoformat()
+            }
+        else:
+            logger.warning("Conditions not met - skipping dependent processing")
+            final_result = {
+                'status': 'skipped',
+                'reason': 'prerequisite_conditions_not_met',
+                'prerequisite_results': prerequisite_results,
+                'logic_result': logic_result,
+                'completion_time': datetime.now().isoformat()
+            }
     
     logger.info("Advanced dependencies flow completed!")
     return final_result
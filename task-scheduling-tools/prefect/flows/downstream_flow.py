@@ -1,22 +1,33 @@
 #!/usr/bin/env python3
 
-from prefect import flow, task
+from prefect import flow, task, get_run_logger
 from prefect.client.schemas import FlowRun
 from prefect.states import Completed, Failed
 from datetime import datetime, timedelta
+import asyncio
+import os
 import time
 import json
 
+# Simulated latency is opt-in so production and CI runs skip it entirely
+SIMULATE_LATENCY = bool(os.getenv('SIMULATE_LATENCY'))
+
+async def simulated_latency(seconds):
+    """Stand-in for processing time that doesn't block the event loop"""
+    if SIMULATE_LATENCY:
+        await asyncio.sleep(seconds)
+
 @task(retries=2, retry_delay_seconds=10)
-def wait_for_upstream(upstream_batch_id=None, timeout_minutes=10):
+async def wait_for_upstream(upstream_batch_id=None, timeout_minutes=10):
     """Wait for upstream flow to complete"""
-    print(f"Waiting for upstream flow completion (batch: {upstream_batch_id})")
+    logger = get_run_logger()
+    logger.info("Waiting for upstream flow completion (batch: %s)", upstream_batch_id)
     
     # In a real scenario, you would check the Prefect API for flow run status
     # For demo purposes, we'll simulate the wait
     wait_time = 5  # seconds
-    print(f"Simulating wait for upstream completion... ({wait_time}s)")
-    time.sleep(wait_time)
+    logger.info("Simulating wait for upstream completion... (%ss)", wait_time)
+    await simulated_latency(wait_time)
     
     # Simulate successful upstream completion
     upstream_result = {
@@ -25,14 +36,15 @@ def wait_for_upstream(upstream_batch_id=None, timeout_minutes=10):
         'completion_time': datetime.now().isoformat()
     }
     
-    print(f"Upstream flow completed: {upstream_result}")
+    logger.info("Upstream flow completed: %s", upstream_result)
     return upstream_result
 
 @task(retries=2, retry_delay_seconds=10)
-def process_downstream_data(upstream_result):
+async def process_downstream_data(upstream_result):
     """Process data from upstream flow"""
-    print(f"Processing downstream data for batch: {upstream_result['batch_id']}")
-    time.sleep(3)
+    logger = get_run_logger()
+    logger.info("Processing downstream data for batch: %s", upstream_result['batch_id'])
+    await simulated_latency(3)
     
     processed_data = {
         'downstream_batch_id': f"downstream_{upstream_result['batch_id']}",
@@ -42,14 +54,15 @@ def process_downstream_data(upstream_result):
         'status': 'processed'
     }
     
-    print(f"Downstream processing completed: {processed_data['downstream_batch_id']}")
+    logger.info("Downstream processing completed: %s", processed_data['downstream_batch_id'])
     return processed_data
 
 @task(retries=2, retry_delay_seconds=10)
-def finalize_processing(processed_data):
+async def finalize_processing(processed_data):
     """Finalize the downstream processing"""
-    print("Finalizing downstream processing...")
-    time.sleep(2)
+    logger = get_run_logger()
+    logger.info("Finalizing downstream processing...")
+    await simulated_latency(2)
     
     final_result = {
         'final_batch_id': processed_data['downstream_batch_id'],
@@ -58,26 +71,27 @@ def finalize_processing(processed_data):
         'status': 'finalized'
     }
     
-    print(f"Processing finalized: {final_result}")
+    logger.info("Processing finalized: %s", final_result)
     return final_result
 
-@flow(name="Downstream Data Processing", log_prints=True)
-def downstream_flow(upstream_batch_id=None):
+@flow(name="Downstream Data Processing")
+async def downstream_flow(upstream_batch_id=None):
     """
     Downstream flow that waits for upstream completion and processes the data
     """
-    print("Starting Downstream Data Processing Flow")
+    logger = get_run_logger()
+    logger.info("Starting Downstream Data Processing Flow")
     
     # Wait for upstream flow to complete
-    upstream_result = wait_for_upstream(upstream_batch_id)
+    upstream_result = await wait_for_upstream(upstream_batch_id)
     
     # Process the downstream data
-    processed_data = process_downstream_data(upstream_result)
+    processed_data = await process_downstream_data(upstream_result)
     
     # Finalize processing
-    final_result = finalize_processing(processed_data)
+    final_result = await finalize_processing(processed_data)
     
-    print("Downstream flow completed successfully!")
+    logger.info("Downstream flow completed successfully!")
     return {
         'status': 'success',
         'upstream_batch': upstream_result['batch_id'],
@@ -86,5 +100,5 @@ def downstream_flow(upstream_batch_id=None):
     }
 
 if __name__ == "__main__":
-    result = downstream_flow()
+    result = asyncio.run(downstream_flow())
     print(f"Final result: {result}")
\ No newline at end of file
@@ -5,11 +5,121 @@ Prefect UI Showcase Flow - Demonstrates visual workflow features
 
 from prefect import flow, task
 from prefect.logging import get_run_logger
+from prefect.task_runners import ConcurrentTaskRunner
 from pydantic import BaseModel
+import anyio
+import asyncio
+import logging
+import os
+import queue
+import threading
 import time
-import random
+import numpy as np
+from contextvars import ContextVar
+from dataclasses import dataclass
 from typing import List, Dict, Any
 
+# Scale every simulated delay from the environment: PIPELINE_SIM_DELAY=0
+# in CI/benchmarks strips the idle time, 1.0 (default) keeps demo pacing
+_DELAY = float(os.getenv("PIPELINE_SIM_DELAY", "1.0"))
+
+def _task_runner():
+    """
+    Pick the showcase task runner from UI_SHOWCASE_TASK_RUNNER: 'dask'
+    or 'ray' spread the per-source tasks across a worker cluster (the
+    optional prefect-dask / prefect-ray extras must be installed);
+    anything else keeps the in-process ConcurrentTaskRunner.
+    """
+    choice = os.getenv("UI_SHOWCASE_TASK_RUNNER", "").lower()
+    if choice == "dask":
+        from prefect_dask.task_runners import DaskTaskRunner
+        return DaskTaskRunner(cluster_kwargs={"n_workers": 8})
+    if choice == "ray":
+        from prefect_ray.task_runners import RayTaskRunner
+        return RayTaskRunner()
+    return ConcurrentTaskRunner()
+
+class _LogBatcher:
+    """
+    Queue structured log records and emit them in batches.
+
+    Under Prefect Cloud every logger call becomes an API round-trip, so
+    the hot mapped tasks enqueue here instead and a daemon thread drains
+    up to _MAX_BATCH records (or whatever arrived within _FLUSH_INTERVAL)
+    into a single logger call.
+    """
+
+    _MAX_BATCH = 64
+    _FLUSH_INTERVAL = 0.25  # seconds
+
+    def __init__(self):
+        self._queue = queue.Queue()
+        self._thread = None
+        self._lock = threading.Lock()
+
+    def enqueue(self, logger, level, message, extra=None):
+        """Queue one record; the drain thread is started on first use"""
+        self._queue.put((logger, level, message, extra))
+        if self._thread is None or not self._thread.is_alive():
+            with self._lock:
+                if self._thread is None or not self._thread.is_alive():
+                    self._thread = threading.Thread(target=self._drain, daemon=True)
+                    self._thread.start()
+
+    def flush(self):
+        """Synchronously emit everything still queued (flow teardown)"""
+        batch = []
+        while True:
+            try:
+                batch.append(self._queue.get_nowait())
+            except queue.Empty:
+                break
+        if batch:
+            self._emit(batch)
+
+    def _drain(self):
+        while True:
+            batch = [self._queue.get()]
+            deadline = time.monotonic() + self._FLUSH_INTERVAL
+            while len(batch) < self._MAX_BATCH:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(self._queue.get(timeout=remaining))
+                except queue.Empty:
+                    break
+            self._emit(batch)
+
+    @staticmethod
+    def _emit(batch):
+        records = []
+        for _, level, message, extra in batch:
+            # Hot tasks enqueue (keys, values) tuples; the dict is only
+            # materialized here, once per flushed record
+            if isinstance(extra, tuple):
+                extra = dict(zip(*extra))
+            records.append({"level": logging.getLevelName(level),
+                            "message": message, **(extra or {})})
+        batch[0][0].info("log batch (%d records)", len(records),
+                         extra={"records": records})
+
+_log_batcher = _LogBatcher()
+
+# Outcome → (level, message prefix) tables: dict dispatch instead of an
+# unpredictable if/else on a random draw in the hot tasks
+_VAL_MSG = {True: (logging.INFO, "✅ Data validation passed"),
+            False: (logging.WARNING, "⚠️ Data validation failed")}
+_LOAD_MSG = {True: (logging.INFO, "✅ Successfully loaded"),
+             False: (logging.ERROR, "❌ Failed to load")}
+
+# Key tuples for the structured extras, built once; the hot tasks zip
+# values against these instead of constructing literal dicts per call
+_EXTRACT_KEYS = ("source", "batch_size", "estimated_records")
+_VT_KEYS = ("validation_score", "is_valid", "original_records",
+            "transformed_records", "transformation_rate")
+_LOAD_KEYS = ("destination", "records", "source")
+
 class DataProcessingConfig(BaseModel):
     """Configuration model for the data processing pipeline"""
     batch_size: int = 100
@@ -17,153 +127,203 @@ class DataProcessingConfig(BaseModel):
     environment: str = "development"
     enable_validation: bool = True
 
+# Shared default so flows don't re-validate an identical model per run
+_DEFAULT_CONFIG = DataProcessingConfig()
+
+@dataclass(slots=True)
+class PipelineRecord:
+    """
+    Per-source record threaded through the pipeline stages. Slots keep
+    each stage's update a fixed-offset field write instead of growing a
+    dict, and every field has a default so later stages can read it
+    unconditionally.
+    """
+    source: str
+    index: int
+    records: int = 0
+    extraction_time: float = 0.0
+    status: str = ""
+    validation_score: float = 0.0
+    is_valid: bool = False
+    validation_time: float = 0.0
+    original_records: int = 0
+    transformed_records: int = 0
+    transformation_time: float = 0.0
+    transformed: bool = False
+    destination: str = ""
+    load_time: float = 0.0
+    loaded: bool = False
+    load_status: str = ""
+
+# One numpy Generator per execution context: unlike the random module's
+# lock-protected global state, concurrent flow runs each get their own
+# lock-free PRNG instead of contending on a shared one
+_RNG: ContextVar[np.random.Generator] = ContextVar("ui_showcase_rng")
+
+def _rng() -> np.random.Generator:
+    """Return this context's Generator, creating it on first use"""
+    try:
+        return _RNG.get()
+    except LookupError:
+        generator = np.random.default_rng()
+        _RNG.set(generator)
+        return generator
+
+# The flow resolves its run logger once and publishes it here; tasks
+# inherit the context copy, so _logger() skips the per-call context walk
+# that get_run_logger() does
+_LOGGER: ContextVar[logging.Logger] = ContextVar("ui_showcase_logger")
+
+def _logger() -> logging.Logger:
+    """Run logger for the current context, resolved at most once"""
+    try:
+        return _LOGGER.get()
+    except LookupError:
+        logger = get_run_logger()
+        _LOGGER.set(logger)
+        return logger
+
 @task(name="🔍 Data Discovery", description="Discover available data sources")
-def discover_data_sources() -> List[str]:
+async def discover_data_sources() -> List[str]:
     """Simulate discovering data sources"""
-    logger = get_run_logger()
+    logger = _logger()
     
     sources = ["customers.csv", "orders.json", "products.xml", "inventory.db"]
     logger.info(f"Discovered {len(sources)} data sources", extra={"sources": sources})
     
     # Simulate processing time
-    time.sleep(2)
+    if _DELAY:
+        await anyio.sleep(2 * _DELAY)
     
     return sources
 
 @task(name="📥 Extract Data", description="Extract data from source")
-def extract_data(source: str, batch_size: int = 100) -> Dict[str, Any]:
+async def extract_data(source: str, index: int, sim: Dict[str, Any], batch_size: int = 100) -> PipelineRecord:
     """Extract data from a given source"""
-    logger = get_run_logger()
-    
-    # Simulate extraction
-    record_count = random.randint(50, 500)
-    logger.info(f"Extracting from {source}", extra={
-        "source": source,
-        "batch_size": batch_size,
-        "estimated_records": record_count
-    })
-    
-    time.sleep(1)
-    
-    extracted_data = {
-        "source": source,
-        "records": record_count,
-        "extraction_time": time.time(),
-        "status": "success"
-    }
+    logger = _logger()
+
+    # Simulated metrics are pre-drawn per run; index into the batch
+    record_count = sim["record_counts"][index]
+    logger.info(f"Extracting from {source}",
+                extra=dict(zip(_EXTRACT_KEYS, (source, batch_size, record_count))))
+    
+    if _DELAY:
+        await anyio.sleep(1 * _DELAY)
+    
+    extracted_data = PipelineRecord(
+        source=source,
+        index=index,
+        records=record_count,
+        extraction_time=time.time(),
+        status="success"
+    )
     
     logger.info(f"Extracted {record_count} records from {source}")
     return extracted_data
 
-@task(name="🔍 Validate Data", description="Validate data quality and schema")
-def validate_data(data: Dict[str, Any]) -> Dict[str, Any]:
-    """Validate extracted data"""
-    logger = get_run_logger()
-    
-    # Simulate validation
-    validation_score = random.uniform(0.8, 1.0)
-    is_valid = validation_score > 0.85
-    
-    logger.info(f"Validating data from {data['source']}", extra={
-        "validation_score": validation_score,
-        "is_valid": is_valid,
-        "record_count": data["records"]
-    })
-    
-    time.sleep(1)
-    
-    validation_result = {
-        **data,
-        "validation_score": validation_score,
-        "is_valid": is_valid,
-        "validation_time": time.time()
-    }
-    
-    if is_valid:
-        logger.info(f"✅ Data validation passed with score {validation_score:.2f}")
-    else:
-        logger.warning(f"⚠️ Data validation failed with score {validation_score:.2f}")
-    
-    return validation_result
+@task(name="🔍🔄 Validate & Transform", description="Validate and transform data in one task")
+async def validate_and_transform(data: PipelineRecord, sim: Dict[str, Any],
+                                 validate: bool = True) -> PipelineRecord:
+    """
+    Validate then transform a record in a single submission. Validation
+    feeds straight into transformation with no branching in between, so
+    fusing the two halves the per-source scheduler bookkeeping.
+    """
+    logger = _logger()
 
-@task(name="🔄 Transform Data", description="Clean and transform data")
-def transform_data(validated_data: Dict[str, Any]) -> Dict[str, Any]:
-    """Transform validated data"""
-    logger = get_run_logger()
-    
-    if not validated_data["is_valid"]:
+    if validate:
+        # Simulate validation
+        validation_score = sim["validation_scores"][data.index]
+        is_valid = validation_score > 0.85
+
+        if _DELAY:
+            await anyio.sleep(1 * _DELAY)
+
+        # Mutate in place - fixed-offset slot writes, no dict growth
+        data.validation_score = validation_score
+        data.is_valid = is_valid
+        data.validation_time = time.time()
+
+        level, prefix = _VAL_MSG[is_valid]
+        _log_batcher.enqueue(logger, level,
+                             f"{prefix} with score {validation_score:.2f}")
+
+    if not data.is_valid:
         logger.warning("Skipping transformation for invalid data")
-        return {**validated_data, "transformed": False}
-    
+        data.transformed = False
+        return data
+
     # Simulate transformation
-    original_count = validated_data["records"]
-    transformed_count = int(original_count * random.uniform(0.9, 0.98))
-    
-    logger.info(f"Transforming data from {validated_data['source']}", extra={
-        "original_records": original_count,
-        "transformed_records": transformed_count,
-        "transformation_rate": transformed_count / original_count
-    })
-    
-    time.sleep(2)
-    
-    transformed_data = {
-        **validated_data,
-        "original_records": original_count,
-        "transformed_records": transformed_count,
-        "transformation_time": time.time(),
-        "transformed": True
-    }
-    
-    logger.info(f"✅ Transformed {original_count} → {transformed_count} records")
-    return transformed_data
+    original_count = data.records
+    transformed_count = int(original_count * sim["transform_rates"][data.index])
+
+    if _DELAY:
+        await anyio.sleep(2 * _DELAY)
+
+    data.original_records = original_count
+    data.transformed_records = transformed_count
+    data.transformation_time = time.time()
+    data.transformed = True
+
+    # One structured record covering both fused stages; the values ride
+    # as a tuple and only become a dict when the batch is flushed
+    _log_batcher.enqueue(logger, logging.INFO,
+                         f"✅ Validated and transformed {data.source}",
+                         (_VT_KEYS, (data.validation_score, data.is_valid,
+                                     original_count, transformed_count,
+                                     transformed_count / original_count)))
+    return data
 
 @task(name="📤 Load Data", description="Load transformed data to destination")
-def load_data(transformed_data: Dict[str, Any], destination: str = "warehouse") -> Dict[str, Any]:
+async def load_data(transformed_data: PipelineRecord, sim: Dict[str, Any], destination: str = "warehouse") -> PipelineRecord:
     """Load transformed data to destination"""
-    logger = get_run_logger()
-    
-    if not transformed_data.get("transformed", False):
+    logger = _logger()
+
+    if not transformed_data.transformed:
         logger.warning("Skipping load for untransformed data")
-        return {**transformed_data, "loaded": False}
-    
+        transformed_data.loaded = False
+        return transformed_data
+
     # Simulate loading
-    records_to_load = transformed_data["transformed_records"]
+    records_to_load = transformed_data.transformed_records
     
-    logger.info(f"Loading {records_to_load} records to {destination}", extra={
-        "destination": destination,
-        "records": records_to_load,
-        "source": transformed_data["source"]
-    })
+    _log_batcher.enqueue(logger, logging.INFO,
+                         f"Loading {records_to_load} records to {destination}",
+                         (_LOAD_KEYS, (destination, records_to_load,
+                                       transformed_data.source)))
     
-    time.sleep(1)
-    
-    # Simulate occasional load failures
-    load_success = random.random() > 0.1  # 90% success rate
-    
-    result = {
-        **transformed_data,
-        "destination": destination,
-        "load_time": time.time(),
-        "loaded": load_success,
-        "load_status": "success" if load_success else "failed"
-    }
-    
-    if load_success:
-        logger.info(f"✅ Successfully loaded {records_to_load} records to {destination}")
-    else:
-        logger.error(f"❌ Failed to load records to {destination}")
+    if _DELAY:
+        await anyio.sleep(1 * _DELAY)
     
+    # Simulate occasional load failures (pre-drawn with a 90% success rate)
+    load_success = sim["load_successes"][transformed_data.index]
+
+    transformed_data.destination = destination
+    transformed_data.load_time = time.time()
+    transformed_data.loaded = load_success
+    transformed_data.load_status = "success" if load_success else "failed"
+    result = transformed_data
+    
+    level, prefix = _LOAD_MSG[load_success]
+    _log_batcher.enqueue(logger, level,
+                         f"{prefix} {records_to_load} records to {destination}")
+
     return result
 
 @task(name="📊 Generate Report", description="Generate processing summary report")
-def generate_report(results: List[Dict[str, Any]]) -> Dict[str, Any]:
+async def generate_report(results: List[PipelineRecord]) -> Dict[str, Any]:
     """Generate a summary report of all processing results"""
-    logger = get_run_logger()
-    
+    logger = _logger()
+
+    # One pass over the results instead of a generator per statistic;
+    # PipelineRecord defaults guarantee the fields exist, so plain
+    # attribute reads need no fallback
     total_sources = len(results)
-    total_records = sum(r.get("original_records", 0) for r in results)
-    successful_loads = sum(1 for r in results if r.get("loaded", False))
+    total_records = 0
+    successful_loads = 0
+    for r in results:
+        total_records += r.original_records
+        successful_loads += r.loaded
     failed_loads = total_sources - successful_loads
     
     report = {
@@ -175,14 +335,16 @@ def generate_report(results: List[Dict[str, Any]]) -> Dict[str, Any]:
         "report_time": time.time()
     }
     
-    logger.info("📊 Processing Summary", extra=report)
-    logger.info(f"✅ Processed {total_sources} sources with {successful_loads} successful loads")
-    
+    _log_batcher.enqueue(logger, logging.INFO, "📊 Processing Summary", report)
+    _log_batcher.enqueue(logger, logging.INFO,
+                         f"✅ Processed {total_sources} sources with {successful_loads} successful loads")
+
     return report
 
-@flow(name="🎨 UI Showcase Pipeline", 
-      description="Comprehensive data pipeline showcasing Prefect UI features")
-def ui_showcase_pipeline(config: DataProcessingConfig = DataProcessingConfig()) -> Dict[str, Any]:
+@flow(name="🎨 UI Showcase Pipeline",
+      description="Comprehensive data pipeline showcasing Prefect UI features",
+      task_runner=_task_runner())
+async def ui_showcase_pipeline(config: DataProcessingConfig = None) -> Dict[str, Any]:
     """
     A comprehensive data processing pipeline that demonstrates Prefect's UI capabilities.
     
@@ -198,50 +360,66 @@ def ui_showcase_pipeline(config: DataProcessingConfig = DataProcessingConfig())
         config: Configuration object with pipeline settings
     """
     logger = get_run_logger()
-    
+    _LOGGER.set(logger)
+
+    # Monotonic start mark - wall-clock time can step under NTP and is
+    # not a duration anyway
+    t0 = time.monotonic_ns()
+
+    config = config or _DEFAULT_CONFIG
+    # Dump the config once and reuse it everywhere it is logged/returned
+    cfg_dump = config.model_dump()
+
     logger.info("🚀 Starting UI Showcase Pipeline", extra={
-        "config": config.dict(),
+        "config": cfg_dump,
         "pipeline_version": "1.0.0"
     })
     
     # Step 1: Discover data sources
-    sources = discover_data_sources()
-    
-    # Step 2: Process each source in parallel
-    extraction_results = []
-    for source in sources:
-        # Extract data
-        extracted = extract_data(source, config.batch_size)
-        extraction_results.append(extracted)
-    
-    # Step 3: Conditional validation (if enabled)
-    validation_results = []
+    sources = await discover_data_sources()
+
+    # Draw the whole run's simulation randomness in one vectorized batch;
+    # concurrent tasks index into these lists by source position instead
+    # of hitting the lock-protected global PRNG once per call
+    rng = _rng()
+    n = len(sources)
+    sim = {
+        "record_counts": rng.integers(50, 501, size=n).tolist(),
+        "validation_scores": rng.uniform(0.8, 1.0, size=n).tolist(),
+        "transform_rates": rng.uniform(0.9, 0.98, size=n).tolist(),
+        "load_successes": (rng.random(n) > 0.1).tolist(),  # 90% success rate
+    }
+
+    # Step 2: Extract every source concurrently - the async tasks all
+    # yield on their simulated I/O, so one gather fans out N-wide on the
+    # flow's event loop without tying up worker threads
+    extraction_results = await asyncio.gather(
+        *(extract_data(source, i, sim, config.batch_size)
+          for i, source in enumerate(sources)))
+
+    # Steps 3-4: Validation and transformation run fused in one task
+    # per source, halving the scheduler overhead of the middle stages
     if config.enable_validation:
         logger.info("🔍 Validation enabled - validating all sources")
-        for extracted in extraction_results:
-            validated = validate_data(extracted)
-            validation_results.append(validated)
     else:
         logger.info("⚠️ Validation disabled - skipping validation step")
-        validation_results = [{**r, "is_valid": True, "validation_score": 1.0} 
-                            for r in extraction_results]
-    
-    # Step 4: Transform valid data
-    transformation_results = []
-    for validated in validation_results:
-        transformed = transform_data(validated)
-        transformation_results.append(transformed)
-    
-    # Step 5: Load transformed data
-    load_results = []
+        # Two field writes per record - no task submissions or copies
+        # just to mark everything valid
+        for record in extraction_results:
+            record.is_valid = True
+            record.validation_score = 1.0
+    transformation_results = await asyncio.gather(
+        *(validate_and_transform(extracted, sim, validate=config.enable_validation)
+          for extracted in extraction_results))
+
+    # Step 5: Load, gathered across sources
     destination = f"{config.environment}_warehouse"
-    
-    for transformed in transformation_results:
-        loaded = load_data(transformed, destination)
-        load_results.append(loaded)
-    
+    load_results = await asyncio.gather(
+        *(load_data(transformed, sim, destination)
+          for transformed in transformation_results))
+
     # Step 6: Generate final report
-    final_report = generate_report(load_results)
+    final_report = await generate_report(load_results)
     
     # Step 7: Environment-specific actions
     if config.environment == "production":
@@ -251,30 +429,34 @@ def ui_showcase_pipeline(config: DataProcessingConfig = DataProcessingConfig())
         logger.info("🧪 Development environment - skipping production features")
         final_report["monitoring_enabled"] = False
     
+    # Drain anything still queued before the flow run closes so no
+    # records are lost with the daemon thread
+    _log_batcher.flush()
+
+    # The old "total_runtime" logged a wall-clock timestamp, not a
+    # duration; report the elapsed time since the start mark instead
     logger.info("✅ Pipeline completed successfully", extra={
-        "total_runtime": time.time(),
+        "total_runtime_ms": (time.monotonic_ns() - t0) / 1e6,
         "final_report": final_report
     })
     
     return {
         "pipeline_status": "completed",
-        "config": config.dict(),
+        "config": cfg_dump,
         "results": load_results,
         "summary": final_report
     }
 
 # Subflow example
 @flow(name="🔄 Data Quality Check", description="Comprehensive data quality validation")
-def data_quality_subflow(data_batch: List[Dict[str, Any]]) -> Dict[str, Any]:
+async def data_quality_subflow(data_batch: List[PipelineRecord]) -> Dict[str, Any]:
     """Subflow for comprehensive data quality checks"""
     logger = get_run_logger()
-    
+    _LOGGER.set(logger)
+
     logger.info(f"🔍 Running quality checks on {len(data_batch)} data sources")
-    
-    quality_scores = []
-    for data in data_batch:
-        score = data.get("validation_score", 0.0)
-        quality_scores.append(score)
+
+    quality_scores = [data.validation_score for data in data_batch]
     
     avg_quality = sum(quality_scores) / len(quality_scores) if quality_scores else 0
     
@@ -291,17 +473,20 @@ def data_quality_subflow(data_batch: List[Dict[str, Any]]) -> Dict[str, Any]:
 
 @flow(name="🎯 Advanced Showcase Pipeline", 
       description="Advanced pipeline with subflows and complex logic")
-def advanced_showcase_pipeline(config: DataProcessingConfig = DataProcessingConfig()) -> Dict[str, Any]:
+async def advanced_showcase_pipeline(config: DataProcessingConfig = None) -> Dict[str, Any]:
     """
     Advanced pipeline demonstrating subflows and complex orchestration
     """
     logger = get_run_logger()
-    
+    _LOGGER.set(logger)
+
+    config = config or _DEFAULT_CONFIG
+
     # Run main pipeline
-    main_result = ui_showcase_pipeline(config)
-    
+    main_result = await ui_showcase_pipeline(config)
+
     # Run quality check subflow
-    quality_result = data_quality_subflow(main_result["results"])
+    quality_result = await data_quality_subflow(main_result["results"])
     
     # Conditional logic based on quality
     if quality_result["passed_quality"]:
@@ -337,11 +522,11 @@ if __name__ == "__main__":
     print("=" * 50)
     
     # Run the basic showcase
-    result = ui_showcase_pipeline(dev_config)
+    result = asyncio.run(ui_showcase_pipeline(dev_config))
     print(f"✅ Basic pipeline completed: {result['pipeline_status']}")
-    
+
     # Run the advanced showcase
-    advanced_result = advanced_showcase_pipeline(prod_config)
+    advanced_result = asyncio.run(advanced_showcase_pipeline(prod_config))
     print(f"✅ Advanced pipeline completed: {advanced_result['final_status']}")
     
     print("\n🌐 View the results in the Prefect UI at: http://localhost:4200")